@@ -17,10 +17,10 @@ SERVICE_NAME="response-engine"
 SERVICE_ACCOUNT="${SERVICE_NAME}@${PROJECT_ID}.iam.gserviceaccount.com"
 IMAGE="gcr.io/${PROJECT_ID}/${SERVICE_NAME}:latest"
 
-echo -e "${BLUE}==========================================${NC}"
-echo -e "${BLUE}  Deploying Response Engine${NC}"
-echo -e "${BLUE}==========================================${NC}"
-echo ""
+echo -e "${BLUE}==========================================${NC}
+${BLUE}  Deploying Response Engine${NC}
+${BLUE}==========================================${NC}
+"
 
 # Check prerequisites
 if ! command -v gcloud &> /dev/null; then
@@ -33,10 +33,10 @@ if ! command -v docker &> /dev/null; then
   exit 1
 fi
 
-echo -e "${YELLOW}Project ID: ${PROJECT_ID}${NC}"
-echo -e "${YELLOW}Region: ${REGION}${NC}"
-echo -e "${YELLOW}Service: ${SERVICE_NAME}${NC}"
-echo ""
+echo -e "${YELLOW}Project ID: ${PROJECT_ID}${NC}
+${YELLOW}Region: ${REGION}${NC}
+${YELLOW}Service: ${SERVICE_NAME}${NC}
+"
 
 # Navigate to repository root (for monorepo build context)
 REPO_ROOT="$(cd "$(dirname "$0")/../.." && pwd)"
@@ -107,13 +107,14 @@ else
   echo -e "${YELLOW}Warning: Health check failed. Service may not be ready yet.${NC}"
 fi
 
-echo ""
-echo -e "${BLUE}==========================================${NC}"
-echo -e "${GREEN}Deployment complete!${NC}"
-echo -e "${BLUE}==========================================${NC}"
-echo ""
-echo -e "${GREEN}Service URL: ${SERVICE_URL}${NC}"
-echo -e "${GREEN}Health check: ${SERVICE_URL}/health${NC}"
-echo ""
-echo -e "${YELLOW}Configure this URL in Google Chat API settings:${NC}"
-echo "${SERVICE_URL}/webhook"
+# Summary banner as a single write
+echo -e "
+${BLUE}==========================================${NC}
+${GREEN}Deployment complete!${NC}
+${BLUE}==========================================${NC}
+
+${GREEN}Service URL: ${SERVICE_URL}${NC}
+${GREEN}Health check: ${SERVICE_URL}/health${NC}
+
+${YELLOW}Configure this URL in Google Chat API settings:${NC}
+${SERVICE_URL}/webhook"
@@ -110,14 +110,14 @@ fi
 
 # Create output directory
 mkdir -p "$OUTPUT_DIR"
-TIMESTAMP=$(date +"%Y%m%d-%H%M%S")
+
+# Read the clock once for the run directory and the unique test run ID
+# (Unix timestamp + nanoseconds) - thread and message IDs are derived from it
+# so they are globally unique across all test runs
+read -r TIMESTAMP TEST_RUN_ID < <(date +"%Y%m%d-%H%M%S %s%N")
 RUN_DIR="$OUTPUT_DIR/run-$TIMESTAMP"
 mkdir -p "$RUN_DIR"
 
-# Create unique test run ID with nanosecond precision
-# This ensures thread IDs are globally unique across all test runs
-TEST_RUN_ID=$(date +%s%N)  # Unix timestamp + nanoseconds
-
 # Initialize markdown report
 REPORT_FILE="$RUN_DIR/TEST_REPORT.md"
 
@@ -128,6 +128,21 @@ if [ ! -f "$QUERIES_FILE" ]; then
     exit 1
 fi
 
+# Parse test queries once up front (a single jq pass instead of one per query)
+QUERY_FUNCTIONS=()
+QUERY_TEXTS=()
+while IFS=$'\t' read -r function_name query; do
+    QUERY_FUNCTIONS+=("$function_name")
+    QUERY_TEXTS+=("$query")
+done < <(jq -r --arg fn "$TEST_FUNCTION" \
+    '.intentFunctions | keys[] as $name | select($fn == "" or $name == $fn) | .[$name].queries[] | [$name, .] | @tsv' \
+    "$QUERIES_FILE")
+
+if [ ${#QUERY_TEXTS[@]} -eq 0 ]; then
+    echo -e "${RED}Error: no test queries found in $TEST_FILE${NC}"
+    exit 1
+fi
+
 # Statistics
 TOTAL_TESTS=0
 SUCCESSFUL_TESTS=0
@@ -136,6 +151,19 @@ FALLBACK_USED=0
 declare -A FUNCTION_STATS
 declare -A FUNCTION_TIMINGS  # Track timing stats per function
 
+# Identity token, fetched once and reused until it nears its 1 hour expiry
+# (ages are measured with bash's SECONDS counter, no date call per query)
+AUTH_TOKEN=""
+AUTH_TOKEN_FETCHED_AT=0
+AUTH_TOKEN_MAX_AGE=3000  # 50 minutes
+
+refresh_auth_token() {
+    if [ -z "$AUTH_TOKEN" ] || [ $((SECONDS - AUTH_TOKEN_FETCHED_AT)) -ge $AUTH_TOKEN_MAX_AGE ]; then
+        AUTH_TOKEN=$(gcloud auth print-identity-token 2>/dev/null)
+        AUTH_TOKEN_FETCHED_AT=$SECONDS
+    fi
+}
+
 # Function to send a test query
 send_query() {
     local query="$1"
@@ -160,9 +188,9 @@ send_query() {
 
 EOF
 
-    # Get auth token
-    TOKEN=$(gcloud auth print-identity-token 2>/dev/null)
-    if [ -z "$TOKEN" ]; then
+    # Get auth token (cached across queries)
+    refresh_auth_token
+    if [ -z "$AUTH_TOKEN" ]; then
         echo -e "${RED}✗ Failed to get auth token${NC}"
         cat >> "$REPORT_FILE" <<EOF
 **Status:** ✗ FAILED
@@ -197,7 +225,7 @@ EOF
     },
     "messagePayload": {
       "message": {
-        "name": "spaces/test-space/messages/test-msg-$(date +%s)",
+        "name": "spaces/test-space/messages/test-msg-${TEST_RUN_ID}-${test_id}",
         "text": "$query",
         "argumentText": "$query",
         "thread": {
@@ -217,7 +245,7 @@ EOFPAYLOAD
     # Send request
     RESPONSE=$(curl -s -w "\n%{http_code}" \
         -X POST \
-        -H "Authorization: Bearer $TOKEN" \
+        -H "Authorization: Bearer $AUTH_TOKEN" \
         -H "Content-Type: application/json" \
         -d "$PAYLOAD" \
         "$SERVICE_URL/webhook" 2>/dev/null)
@@ -250,15 +278,19 @@ EOF
         --project=$PROJECT_ID > "/tmp/test-${test_id}.json" 2>/dev/null
 
     if [ -s "/tmp/test-${test_id}.json" ]; then
-        local response_text=$(cat "/tmp/test-${test_id}.json" | jq -r '.[0].jsonPayload.responseText // ""')
-        local total_ms=$(cat "/tmp/test-${test_id}.json" | jq -r '.[0].jsonPayload.totalDurationMs // 0')
-        local resolve_tenant_ms=$(cat "/tmp/test-${test_id}.json" | jq -r '.[0].jsonPayload.timings.resolveTenant // 0')
-        local get_context_ms=$(cat "/tmp/test-${test_id}.json" | jq -r '.[0].jsonPayload.timings.getContext // 0')
-        local generate_response_ms=$(cat "/tmp/test-${test_id}.json" | jq -r '.[0].jsonPayload.timings.generateResponse // 0')
-        local format_response_ms=$(cat "/tmp/test-${test_id}.json" | jq -r '.[0].jsonPayload.timings.formatResponse // 0')
-        local tool_calls=$(cat "/tmp/test-${test_id}.json" | jq -r '.[0].jsonPayload.toolCallsCount // 0')
-        local chart_generated=$(cat "/tmp/test-${test_id}.json" | jq -r '.[0].jsonPayload.chartGenerated // false')
-        local tool_calls_summary=$(cat "/tmp/test-${test_id}.json" | jq -c '.[0].jsonPayload.toolCallsSummary // []')
+        # Extract all fields in a single jq pass (values are @sh-quoted for eval)
+        local response_text total_ms resolve_tenant_ms get_context_ms generate_response_ms
+        local format_response_ms tool_calls chart_generated tool_calls_summary
+        eval "$(jq -r '.[0].jsonPayload // {} | @sh "
+            response_text=\(.responseText // "")
+            total_ms=\(.totalDurationMs // 0)
+            resolve_tenant_ms=\(.timings.resolveTenant // 0)
+            get_context_ms=\(.timings.getContext // 0)
+            generate_response_ms=\(.timings.generateResponse // 0)
+            format_response_ms=\(.timings.formatResponse // 0)
+            tool_calls=\(.toolCallsCount // 0)
+            chart_generated=\(.chartGenerated // false)
+            tool_calls_summary=\(.toolCallsSummary // [] | tojson)"' "/tmp/test-${test_id}.json")"
 
         # Display response preview
         if [ -n "$response_text" ] && [ "$response_text" != "null" ]; then
@@ -463,29 +495,22 @@ EOF
     declare -gA FUNCTION_STATS
     declare -gA FUNCTION_TIMINGS
 
-    # Read and execute test queries
+    # Execute test queries (parsed once at startup)
     local test_id=0
+    local current_function=""
 
-    # Get list of functions to test
-    if [ -n "$TEST_FUNCTION" ]; then
-        FUNCTIONS=("$TEST_FUNCTION")
-    else
-        FUNCTIONS=($(cat "$QUERIES_FILE" | jq -r '.intentFunctions | keys[]'))
-    fi
-
-    for function_name in "${FUNCTIONS[@]}"; do
-        echo -e "\n${YELLOW}═══════════════════════════════════════════════════${NC}"
-        echo -e "${YELLOW}Testing: $function_name${NC}"
-        echo -e "${YELLOW}═══════════════════════════════════════════════════${NC}"
+    for ((i=0; i<${#QUERY_TEXTS[@]}; i++)); do
+        local function_name="${QUERY_FUNCTIONS[$i]}"
 
-        # Get queries for this function
-        local query_count=$(cat "$QUERIES_FILE" | jq -r ".intentFunctions.${function_name}.queries | length")
+        if [ "$function_name" != "$current_function" ]; then
+            current_function="$function_name"
+            echo -e "\n${YELLOW}═══════════════════════════════════════════════════${NC}"
+            echo -e "${YELLOW}Testing: $function_name${NC}"
+            echo -e "${YELLOW}═══════════════════════════════════════════════════${NC}"
+        fi
 
-        for ((i=0; i<query_count; i++)); do
-            test_id=$((test_id + 1))
-            local query=$(cat "$QUERIES_FILE" | jq -r ".intentFunctions.${function_name}.queries[$i]")
-            send_query "$query" "$function_name" "$test_id"
-        done
+        test_id=$((test_id + 1))
+        send_query "${QUERY_TEXTS[$i]}" "$function_name" "$test_id"
     done
 
     # Generate summary
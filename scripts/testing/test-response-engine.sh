@@ -11,6 +11,8 @@
 #   --queries <file>     Custom queries file (default: built-in test queries)
 #   --output-dir <path>  Output directory for logs (default: ./test-results)
 #   --wait-time <secs>   Wait time after sending query (default: 12)
+#   --max-parallel <n>   Maximum queries in flight at once (default: 5)
+#   --no-warmup          Skip the warm-up query sent before the test queries
 #
 # Example:
 #   ./scripts/testing/test-response-engine.sh --revision response-engine-00064-xkm
@@ -28,6 +30,8 @@ REGION="us-central1"
 REVISION=""
 OUTPUT_DIR="$PROJECT_ROOT/test-results"
 WAIT_TIME=12
+MAX_PARALLEL=5
+WARMUP=true
 
 # Colors
 GREEN='\033[0;32m'
@@ -51,6 +55,18 @@ while [[ $# -gt 0 ]]; do
             WAIT_TIME="$2"
             shift 2
             ;;
+        --max-parallel)
+            if ! [[ "${2:-}" =~ ^[1-9][0-9]*$ ]]; then
+                echo "Invalid --max-parallel value: '${2:-}' (must be a positive integer)"
+                exit 1
+            fi
+            MAX_PARALLEL="$2"
+            shift 2
+            ;;
+        --no-warmup)
+            WARMUP=false
+            shift
+            ;;
         --help)
             head -n 20 "$0" | grep "^#" | sed 's/^# *//'
             exit 0
@@ -79,7 +95,13 @@ TIMESTAMP=$(date +"%Y%m%d-%H%M%S")
 RUN_DIR="$OUTPUT_DIR/run-$TIMESTAMP"
 mkdir -p "$RUN_DIR"
 
+# Lower bound for log filtering, shared by all queries (they run concurrently
+# and their logs are matched on userMessage)
+LOG_TIMESTAMP=$(date -u +"%Y-%m-%dT%H:%M:%S")
+
 # Function to send a test query
+# Each query gets its own DM space (the engine keys DM history by space), so
+# concurrent queries never share conversation context
 send_query() {
     local query="$1"
     local test_name="$2"
@@ -89,13 +111,6 @@ send_query() {
     echo -e "${YELLOW}Query: $query${NC}"
     echo -e "${YELLOW}========================================${NC}\n"
 
-    # Get auth token
-    echo "Getting auth token..."
-    TOKEN=$(gcloud auth print-identity-token)
-
-    # Record timestamp for log filtering
-    LOG_TIMESTAMP=$(date -u +"%Y-%m-%dT%H:%M:%S")
-
     # Create Google Chat webhook payload
     PAYLOAD=$(cat <<EOF
 {
@@ -107,15 +122,15 @@ send_query() {
     },
     "messagePayload": {
       "message": {
-        "name": "spaces/test-space/messages/test-msg-$(date +%s)",
+        "name": "spaces/test-space/messages/test-msg-${TIMESTAMP}-${test_name}",
         "text": "$query",
         "argumentText": "$query",
         "thread": {
-          "name": "spaces/test-space/threads/test-thread-1"
+          "name": "spaces/test-space-${test_name}/threads/test-thread-1"
         }
       },
       "space": {
-        "name": "spaces/test-space-123",
+        "name": "spaces/test-space-${test_name}",
         "type": "DM"
       }
     }
@@ -151,57 +166,30 @@ EOF
     # Fetch logs for this query
     echo -e "\n${YELLOW}Fetching logs...${NC}"
 
-    # Get all final text responses
+    # Get the final response for this query (matched on userMessage so
+    # concurrent queries don't pick up each other's logs)
     echo -e "\n--- Final Response Status ---"
     gcloud logging read \
         "resource.type=cloud_run_revision AND \
          resource.labels.service_name=response-engine AND \
          resource.labels.revision_name=$REVISION AND \
          timestamp>=\"$LOG_TIMESTAMP\" AND \
-         jsonPayload.message=\"Final text response received\"" \
-        --limit 5 \
+         jsonPayload.message=\"Response generated successfully\" AND \
+         jsonPayload.userMessage=\"$query\"" \
+        --limit 1 \
         --format=json \
         --project=$PROJECT_ID > "$RUN_DIR/${test_name}-final.json"
 
-    if [ -s "$RUN_DIR/${test_name}-final.json" ]; then
-        local text_length=$(cat "$RUN_DIR/${test_name}-final.json" | jq -r '.[0].jsonPayload.textLength // 0')
-        local used_fallback=$(cat "$RUN_DIR/${test_name}-final.json" | jq -r '.[0].jsonPayload.usedFallback // false')
+    local text_length=$(jq -r '.[0].jsonPayload.responseText // "" | length' "$RUN_DIR/${test_name}-final.json")
 
-        if [ "$text_length" -gt 0 ]; then
-            echo -e "${GREEN}✓ SUCCESS${NC} - textLength: $text_length"
-            if [ "$used_fallback" = "true" ]; then
-                echo -e "${BLUE}  ℹ Used fallback pattern${NC}"
-            fi
-        else
-            echo -e "${RED}✗ FAILED${NC} - Empty response (textLength: 0)"
-        fi
+    if [ "$text_length" -gt 0 ]; then
+        echo -e "${GREEN}✓ SUCCESS${NC} - textLength: $text_length"
+    elif [ "$(jq 'length' "$RUN_DIR/${test_name}-final.json")" -gt 0 ]; then
+        echo -e "${RED}✗ FAILED${NC} - Empty response (textLength: 0)"
     else
         echo -e "${RED}✗ NO RESPONSE${NC} - No final response logged"
     fi
 
-    # Get fallback logs
-    gcloud logging read \
-        "resource.type=cloud_run_revision AND \
-         resource.labels.service_name=response-engine AND \
-         resource.labels.revision_name=$REVISION AND \
-         timestamp>=\"$LOG_TIMESTAMP\" AND \
-         jsonPayload.message:\"Fallback\"" \
-        --limit 10 \
-        --format=json \
-        --project=$PROJECT_ID > "$RUN_DIR/${test_name}-fallback.json"
-
-    # Get debug info for empty responses
-    gcloud logging read \
-        "resource.type=cloud_run_revision AND \
-         resource.labels.service_name=response-engine AND \
-         resource.labels.revision_name=$REVISION AND \
-         timestamp>=\"$LOG_TIMESTAMP\" AND \
-         severity=WARNING AND \
-         jsonPayload.debugInfo.rawCandidate:*" \
-        --limit 5 \
-        --format=json \
-        --project=$PROJECT_ID > "$RUN_DIR/${test_name}-debug.json"
-
     echo -e "\n${GREEN}Logs saved to: $RUN_DIR/${test_name}-*.json${NC}"
 }
 
@@ -215,12 +203,63 @@ echo "Output Dir: $RUN_DIR"
 echo "Time:       $(date)"
 echo ""
 
-# Run test queries
-send_query "compare may and june sushi sales in 2025" "test-1-sushi-comparison"
-send_query "compare june and july sushi sales in 2025" "test-2-sushi-comparison"
-send_query "compare april and may beer sales in 2025" "test-3-beer-comparison"
-send_query "compare may and june food sales in 2025" "test-4-food-comparison"
-send_query "what were the top 5 selling items in july 2025" "test-5-top-items"
+# Get auth token once and share it across all queries (identity tokens are valid for 1 hour)
+echo "Getting auth token..."
+TOKEN=$(gcloud auth print-identity-token)
+if [ -z "$TOKEN" ]; then
+    echo -e "${RED}✗ Failed to get auth token${NC}"
+    exit 1
+fi
+
+# Send one warm-up query and let it finish before the fan-out, so the test
+# queries hit a warm instance and Gemini's cache of the shared system
+# instruction prefix instead of each paying the cold prefill
+if [ "$WARMUP" = true ]; then
+    echo "Sending warm-up query..."
+    if send_query "what was the total sales in july 2025" "warmup" > "$RUN_DIR/warmup.log" 2>&1; then
+        echo -e "${GREEN}✓ Warm-up complete${NC}\n"
+    else
+        echo -e "${YELLOW}⚠ Warm-up query failed (continuing)${NC}\n"
+    fi
+fi
+
+# Run test queries concurrently (at most MAX_PARALLEL in flight)
+# Total wall-clock is roughly the slowest query instead of the sum of all of them
+TEST_NAMES=()
+TEST_PIDS=()
+declare -A TEST_EXIT_CODES
+
+run_query() {
+    local query="$1"
+    local test_name="$2"
+
+    # Poll rather than `wait -n`, which would reap a job and lose its exit status
+    while [ "$(jobs -rp | wc -l)" -ge "$MAX_PARALLEL" ]; do
+        sleep 0.2
+    done
+
+    send_query "$query" "$test_name" > "$RUN_DIR/${test_name}.log" 2>&1 &
+    TEST_NAMES+=("$test_name")
+    TEST_PIDS+=("$!")
+}
+
+run_query "compare may and june sushi sales in 2025" "test-1-sushi-comparison"
+run_query "compare june and july sushi sales in 2025" "test-2-sushi-comparison"
+run_query "compare april and may beer sales in 2025" "test-3-beer-comparison"
+run_query "compare may and june food sales in 2025" "test-4-food-comparison"
+run_query "what were the top 5 selling items in july 2025" "test-5-top-items"
+
+echo "Waiting for ${#TEST_NAMES[@]} queries to complete..."
+for i in "${!TEST_NAMES[@]}"; do
+    exit_code=0
+    wait "${TEST_PIDS[$i]}" || exit_code=$?
+    TEST_EXIT_CODES[${TEST_NAMES[$i]}]=$exit_code
+done
+
+# Show per-test output in submission order
+for test_name in "${TEST_NAMES[@]}"; do
+    cat "$RUN_DIR/${test_name}.log"
+done
 
 # Generate summary report
 echo -e "\n${YELLOW}========================================${NC}"
@@ -240,31 +279,31 @@ cat > "$SUMMARY_FILE" <<EOF
 
 EOF
 
-# Count successes and failures
-TOTAL=0
+# Count successes and failures over every submitted test (a query whose
+# request failed has no -final.json but still counts as a failure)
+TOTAL=${#TEST_NAMES[@]}
 SUCCESS=0
-FALLBACK_USED=0
 
-for file in "$RUN_DIR"/test-*-final.json; do
-    if [ -f "$file" ]; then
-        TOTAL=$((TOTAL + 1))
-        test_name=$(basename "$file" | sed 's/-final.json//')
-        text_length=$(cat "$file" | jq -r '.[0].jsonPayload.textLength // 0')
-        used_fallback=$(cat "$file" | jq -r '.[0].jsonPayload.usedFallback // false')
+for test_name in "${TEST_NAMES[@]}"; do
+    file="$RUN_DIR/${test_name}-final.json"
+    text_length=0
+
+    if [ "${TEST_EXIT_CODES[$test_name]}" -ne 0 ]; then
+        status="✗ FAILED (request failed, see ${test_name}.log)"
+    else
+        if [ -f "$file" ]; then
+            text_length=$(jq -r '.[0].jsonPayload.responseText // "" | length' "$file")
+        fi
 
         if [ "$text_length" -gt 0 ]; then
             SUCCESS=$((SUCCESS + 1))
             status="✓ SUCCESS"
-            if [ "$used_fallback" = "true" ]; then
-                FALLBACK_USED=$((FALLBACK_USED + 1))
-                status="$status (fallback)"
-            fi
         else
             status="✗ FAILED"
         fi
-
-        echo "- **$test_name**: $status (textLength: $text_length)" >> "$SUMMARY_FILE"
     fi
+
+    echo "- **$test_name**: $status (textLength: $text_length)" >> "$SUMMARY_FILE"
 done
 
 cat >> "$SUMMARY_FILE" <<EOF
@@ -274,7 +313,6 @@ cat >> "$SUMMARY_FILE" <<EOF
 - **Total Tests:** $TOTAL
 - **Successful:** $SUCCESS
 - **Failed:** $((TOTAL - SUCCESS))
-- **Fallback Used:** $FALLBACK_USED
 - **Success Rate:** $(echo "scale=1; $SUCCESS * 100 / $TOTAL" | bc)%
 
 ## Log Files
@@ -5,6 +5,10 @@ import { mockConversationContext } from '../fixtures/mockResponses';
 jest.mock('axios');
 const mockedAxios = axios as jest.Mocked<typeof axios>;
 
+// Unsigned JWT with the given expiry (seconds since epoch)
+const makeIdToken = (exp: number) =>
+  ['header', Buffer.from(JSON.stringify({ exp })).toString('base64url'), 'signature'].join('.');
+
 describe('ConversationClient', () => {
   let conversationClient: ConversationClient;
   let mockAxiosInstance: any;
@@ -14,6 +18,8 @@ describe('ConversationClient', () => {
       post: jest.fn()
     };
     mockedAxios.create = jest.fn().mockReturnValue(mockAxiosInstance);
+    // Default: metadata server unavailable (requests proceed without auth)
+    mockedAxios.get = jest.fn().mockRejectedValue(new Error('Metadata server unavailable'));
     conversationClient = new ConversationClient('http://localhost:3002');
   });
 
@@ -24,7 +30,7 @@ describe('ConversationClient', () => {
   describe('getContext', () => {
     it('should return conversation context', async () => {
       mockAxiosInstance.post.mockResolvedValue({
-        data: mockConversationContext
+        data: { success: true, context: mockConversationContext }
       });
 
       const context = await conversationClient.getContext(
@@ -40,7 +46,8 @@ describe('ConversationClient', () => {
         threadId: 'thread456',
         currentMessage: 'What were sales today?',
         maxMessages: 10
-      });
+
+      }, { headers: {} });
     });
 
     it('should fallback to empty context on failure', async () => {
@@ -58,7 +65,7 @@ describe('ConversationClient', () => {
 
     it('should support custom maxMessages', async () => {
       mockAxiosInstance.post.mockResolvedValue({
-        data: mockConversationContext
+        data: { success: true, context: mockConversationContext }
       });
 
       await conversationClient.getContext(
@@ -73,7 +80,75 @@ describe('ConversationClient', () => {
         threadId: 'thread456',
         currentMessage: 'Test',
         maxMessages: 5
-      });
+
+      }, { headers: {} });
+    });
+  });
+
+  describe('authentication', () => {
+    const idToken = makeIdToken(Math.floor(Date.now() / 1000) + 3600);
+
+    it('should reuse the identity token across requests', async () => {
+      mockedAxios.get.mockResolvedValue({ data: idToken });
+      mockAxiosInstance.post.mockResolvedValue({ data: { success: true, context: mockConversationContext } });
+
+      await conversationClient.getContext('user123', 'thread456', 'Test');
+      await conversationClient.storeMessage('user123', 'thread456', 'user', 'Test');
+
+      expect(mockedAxios.get).toHaveBeenCalledTimes(1);
+      expect(mockAxiosInstance.post).toHaveBeenLastCalledWith(
+        '/store-message',
+        expect.any(Object),
+        { headers: { 'Authorization': `Bearer ${idToken}` } }
+      );
+    });
+
+    it('should refresh a token close to its expiry', async () => {
+      const expiringToken = makeIdToken(Math.floor(Date.now() / 1000) + 60);
+      mockedAxios.get
+        .mockResolvedValueOnce({ data: expiringToken })
+        .mockResolvedValueOnce({ data: idToken });
+      mockAxiosInstance.post.mockResolvedValue({ data: { success: true } });
+
+      await conversationClient.storeMessage('user123', 'thread456', 'user', 'Test');
+      await conversationClient.storeMessage('user123', 'thread456', 'user', 'Test');
+
+      expect(mockedAxios.get).toHaveBeenCalledTimes(2);
+      expect(mockAxiosInstance.post).toHaveBeenLastCalledWith(
+        '/store-message',
+        expect.any(Object),
+        { headers: { 'Authorization': `Bearer ${idToken}` } }
+      );
+    });
+
+    it('should drop the cached token after a 401', async () => {
+      mockedAxios.get.mockResolvedValue({ data: idToken });
+      mockAxiosInstance.post
+        .mockRejectedValueOnce(Object.assign(new Error('Unauthorized'), { response: { status: 401 } }))
+        .mockResolvedValueOnce({ data: { success: true } });
+
+      await conversationClient.storeMessage('user123', 'thread456', 'user', 'Test');
+      await conversationClient.storeMessage('user123', 'thread456', 'user', 'Test');
+
+      expect(mockedAxios.get).toHaveBeenCalledTimes(2);
+    });
+
+    it('should retry the token fetch after a failure', async () => {
+      mockedAxios.get
+        .mockRejectedValueOnce(new Error('Metadata server unavailable'))
+        .mockResolvedValueOnce({ data: idToken });
+      mockAxiosInstance.post.mockResolvedValue({ data: { success: true } });
+
+      await conversationClient.storeMessage('user123', 'thread456', 'user', 'Test');
+      await conversationClient.storeMessage('user123', 'thread456', 'user', 'Test');
+
+      expect(mockedAxios.get).toHaveBeenCalledTimes(2);
+      expect(mockAxiosInstance.post).toHaveBeenNthCalledWith(
+        1, '/store-message', expect.any(Object), { headers: {} }
+      );
+      expect(mockAxiosInstance.post).toHaveBeenNthCalledWith(
+        2, '/store-message', expect.any(Object), { headers: { 'Authorization': `Bearer ${idToken}` } }
+      );
     });
   });
 
@@ -93,7 +168,8 @@ describe('ConversationClient', () => {
         threadId: 'thread456',
         role: 'user',
         content: 'What were sales today?'
-      });
+
+      }, { headers: {} });
     });
 
     it('should store assistant message', async () => {
@@ -111,7 +187,8 @@ describe('ConversationClient', () => {
         threadId: 'thread456',
         role: 'assistant',
         content: 'Sales today were $5,234.'
-      });
+
+      }, { headers: {} });
     });
 
     it('should not throw on failure (non-critical)', async () => {
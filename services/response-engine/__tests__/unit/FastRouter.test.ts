@@ -0,0 +1,53 @@
+import { FastRouter } from '../../src/core/FastRouter';
+
+describe('FastRouter', () => {
+  let fastRouter: FastRouter;
+
+  beforeEach(() => {
+    fastRouter = new FastRouter();
+  });
+
+  describe('route', () => {
+    it('should route top N items for a month', () => {
+      const result = fastRouter.route('What were the top 5 selling items in July 2025?');
+
+      expect(result).toEqual({
+        name: 'show_top_items',
+        args: { limit: 5, startDate: '2025-07-01', endDate: '2025-07-31' }
+      });
+    });
+
+    it('should route total sales for a month', () => {
+      const result = fastRouter.route('total sales for feb 2024');
+
+      expect(result).toEqual({
+        name: 'get_total_sales',
+        args: { startDate: '2024-02-01', endDate: '2024-02-29' }
+      });
+    });
+
+    it('should route category breakdown for a month', () => {
+      const result = fastRouter.route('Sales by category in June 2025');
+
+      expect(result).toEqual({
+        name: 'show_category_breakdown',
+        args: { startDate: '2025-06-01', endDate: '2025-06-30' }
+      });
+    });
+
+    it('should not route a top N query with a zero limit', () => {
+      expect(fastRouter.route('top 0 items in july 2025')).toBeNull();
+      expect(fastRouter.route('top 000 items in july 2025')).toBeNull();
+    });
+
+    it('should not route queries without an explicit year', () => {
+      expect(fastRouter.route('total sales in july')).toBeNull();
+    });
+
+    it('should not route anything beyond a trivial query', () => {
+      expect(fastRouter.route('compare may and june sushi sales in 2025')).toBeNull();
+      expect(fastRouter.route('total sushi sales in july 2025')).toBeNull();
+      expect(fastRouter.route('top 5 items in july 2025 excluding beer')).toBeNull();
+    });
+  });
+});
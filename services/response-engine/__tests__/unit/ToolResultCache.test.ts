@@ -0,0 +1,119 @@
+import { ToolResultCache, toolCallKey } from '../../src/tools/ToolResultCache';
+
+describe('ToolResultCache', () => {
+  let cache: ToolResultCache;
+  const result = { rows: [{ total: 100 }], totalRows: 1, executionTimeMs: 50 };
+
+  beforeEach(() => {
+    cache = new ToolResultCache(60000, 2);
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  describe('toolCallKey', () => {
+    it('should be independent of argument order', () => {
+      const key1 = toolCallKey('get_total_sales', { startDate: '2025-05-01', endDate: '2025-05-31' });
+      const key2 = toolCallKey('get_total_sales', { endDate: '2025-05-31', startDate: '2025-05-01' });
+
+      expect(key1).toBe(key2);
+    });
+
+    it('should differ by function name and args', () => {
+      const args = { startDate: '2025-05-01', endDate: '2025-05-31' };
+
+      expect(toolCallKey('get_total_sales', args)).not.toBe(toolCallKey('show_daily_sales', args));
+      expect(toolCallKey('get_total_sales', args)).not.toBe(
+        toolCallKey('get_total_sales', { ...args, category: 'Sushi' })
+      );
+    });
+  });
+
+  describe('get/set', () => {
+    it('should return cached result for same session and call', () => {
+      cache.set('thread1', 'get_total_sales', { startDate: '2025-05-01' }, result);
+
+      expect(cache.get('thread1', 'get_total_sales', { startDate: '2025-05-01' })).toBe(result);
+    });
+
+    it('should not share results across sessions', () => {
+      cache.set('thread1', 'get_total_sales', { startDate: '2025-05-01' }, result);
+
+      expect(cache.get('thread2', 'get_total_sales', { startDate: '2025-05-01' })).toBeUndefined();
+    });
+
+    it('should expire entries after the TTL', () => {
+      const now = Date.now();
+      jest.spyOn(Date, 'now').mockReturnValue(now);
+      cache.set('thread1', 'get_total_sales', {}, result);
+
+      jest.spyOn(Date, 'now').mockReturnValue(now + 60001);
+
+      expect(cache.get('thread1', 'get_total_sales', {})).toBeUndefined();
+    });
+
+    it('should evict least recently used sessions', () => {
+      cache.set('thread1', 'get_total_sales', {}, result);
+      cache.set('thread2', 'get_total_sales', {}, result);
+      cache.set('thread1', 'show_daily_sales', {}, result);  // thread1 now most recent
+      cache.set('thread3', 'get_total_sales', {}, result);
+
+      expect(cache.get('thread1', 'get_total_sales', {})).toBe(result);
+      expect(cache.get('thread2', 'get_total_sales', {})).toBeUndefined();
+      expect(cache.get('thread3', 'get_total_sales', {})).toBe(result);
+    });
+
+    it('should treat a cache hit as use when evicting sessions', () => {
+      cache.set('thread1', 'get_total_sales', {}, result);
+      cache.set('thread2', 'get_total_sales', {}, result);
+      cache.get('thread1', 'get_total_sales', {});  // thread1 read, not written
+      cache.set('thread3', 'get_total_sales', {}, result);
+
+      expect(cache.get('thread1', 'get_total_sales', {})).toBe(result);
+      expect(cache.get('thread2', 'get_total_sales', {})).toBeUndefined();
+    });
+  });
+
+  describe('expired entry pruning', () => {
+    it('should drop expired entries from a session when writing to it', () => {
+      const now = Date.now();
+      jest.spyOn(Date, 'now').mockReturnValue(now);
+      cache.set('thread1', 'get_total_sales', { startDate: '2025-05-01' }, result);
+      cache.set('thread1', 'get_total_sales', { startDate: '2025-06-01' }, result);
+
+      // Both entries have expired but were never read again
+      jest.spyOn(Date, 'now').mockReturnValue(now + 60001);
+      cache.set('thread1', 'get_total_sales', { startDate: '2025-07-01' }, result);
+
+      const session = (cache as any).sessions.get('thread1') as Map<string, unknown>;
+      expect(session.size).toBe(1);
+      expect(cache.get('thread1', 'get_total_sales', { startDate: '2025-07-01' })).toBe(result);
+    });
+  });
+
+  describe('maxEntriesPerSession', () => {
+    it('should evict oldest entries within a session', () => {
+      const smallCache = new ToolResultCache(60000, 10, 2);
+      smallCache.set('shared', 'get_total_sales', { startDate: '2025-05-01' }, result);
+      smallCache.set('shared', 'get_total_sales', { startDate: '2025-06-01' }, result);
+      smallCache.set('shared', 'get_total_sales', { startDate: '2025-07-01' }, result);
+
+      expect(smallCache.get('shared', 'get_total_sales', { startDate: '2025-05-01' })).toBeUndefined();
+      expect(smallCache.get('shared', 'get_total_sales', { startDate: '2025-06-01' })).toBe(result);
+      expect(smallCache.get('shared', 'get_total_sales', { startDate: '2025-07-01' })).toBe(result);
+    });
+  });
+
+  describe('clear', () => {
+    it('should clear a single session', () => {
+      cache.set('thread1', 'get_total_sales', {}, result);
+      cache.set('thread2', 'get_total_sales', {}, result);
+
+      cache.clear('thread1');
+
+      expect(cache.get('thread1', 'get_total_sales', {})).toBeUndefined();
+      expect(cache.get('thread2', 'get_total_sales', {})).toBe(result);
+    });
+  });
+});
@@ -0,0 +1,57 @@
+import { SchemaType } from '@google-cloud/vertexai';
+import { INTENT_FUNCTIONS } from '../../src/tools/intentFunctions';
+import { FastRouter } from '../../src/core/FastRouter';
+
+describe('INTENT_FUNCTIONS', () => {
+  it('should have unique snake_case names', () => {
+    const names = INTENT_FUNCTIONS.map(fn => fn.name);
+
+    expect(new Set(names).size).toBe(names.length);
+    names.forEach(name => expect(name).toMatch(/^[a-z]+(_[a-z]+)*$/));
+  });
+
+  it('should declare a description and object parameters for every function', () => {
+    INTENT_FUNCTIONS.forEach(fn => {
+      expect(fn.description).toBeTruthy();
+      expect(fn.parameters?.type).toBe(SchemaType.OBJECT);
+      expect(Object.keys(fn.parameters?.properties || {}).length).toBeGreaterThan(0);
+    });
+  });
+
+  it('should only require declared parameters', () => {
+    INTENT_FUNCTIONS.forEach(fn => {
+      const properties = Object.keys(fn.parameters?.properties || {});
+      (fn.parameters?.required || []).forEach(param => {
+        expect(properties).toContain(param);
+      });
+    });
+  });
+
+  it('should declare date parameters as YYYY-MM-DD strings', () => {
+    INTENT_FUNCTIONS.forEach(fn => {
+      Object.entries(fn.parameters?.properties || {})
+        .filter(([name]) => /Date\d?$/.test(name))
+        .forEach(([, schema]: [string, any]) => {
+          expect(schema.type).toBe(SchemaType.STRING);
+          expect(schema.description).toContain('YYYY-MM-DD');
+        });
+    });
+  });
+
+  it('should cover every function the FastRouter can route to', () => {
+    const fastRouter = new FastRouter();
+    const routed = [
+      fastRouter.route('top 5 items in july 2025'),
+      fastRouter.route('total sales in july 2025'),
+      fastRouter.route('sales by category in july 2025')
+    ];
+
+    routed.forEach(call => {
+      const fn = INTENT_FUNCTIONS.find(f => f.name === call?.name);
+      expect(fn).toBeDefined();
+      (fn?.parameters?.required || []).forEach(param => {
+        expect(call?.args).toHaveProperty(param);
+      });
+    });
+  });
+});
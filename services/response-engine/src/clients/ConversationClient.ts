@@ -1,5 +1,20 @@
 import axios, { AxiosInstance } from 'axios';
-import { GoogleAuth } from 'google-auth-library';
+
+// Refresh identity tokens this long before their `exp` claim
+const ID_TOKEN_REFRESH_MARGIN_MS = 5 * 60 * 1000;
+
+/**
+ * Read the expiry (ms since epoch) from an identity token's `exp` claim
+ * @returns 0 if the token can't be decoded (treated as already expired)
+ */
+function getIdTokenExpiry(idToken: string): number {
+  try {
+    const payload = JSON.parse(Buffer.from(idToken.split('.')[1], 'base64url').toString('utf8'));
+    return typeof payload.exp === 'number' ? payload.exp * 1000 : 0;
+  } catch {
+    return 0;
+  }
+}
 
 interface ConversationMessage {
   role: 'user' | 'assistant';
@@ -38,11 +53,13 @@ interface StoreMessageRequest {
  * - Getting conversation context
  * - Storing messages
  * - Fallback to empty context on failure
- * - Service-to-service authentication
+ * - Service-to-service authentication (identity token cached until shortly before its exp)
  */
 export class ConversationClient {
   private client: AxiosInstance;
-  private auth: GoogleAuth;
+  private idToken: string | null = null;
+  private idTokenExpiresAt = 0;
+  private idTokenPending: Promise<string | null> | null = null;
 
   constructor(
     private conversationManagerUrl: string,
@@ -55,14 +72,29 @@ export class ConversationClient {
         'Content-Type': 'application/json'
       }
     });
-
-    this.auth = new GoogleAuth();
   }
 
   /**
    * Get authorization header with identity token from metadata server
    */
   private async getAuthHeaders(): Promise<Record<string, string>> {
+    if (!this.idToken || Date.now() >= this.idTokenExpiresAt - ID_TOKEN_REFRESH_MARGIN_MS) {
+      // Concurrent requests share one in-flight token fetch
+      if (!this.idTokenPending) {
+        this.idTokenPending = this.fetchIdToken().finally(() => {
+          this.idTokenPending = null;
+        });
+      }
+      await this.idTokenPending;
+    }
+
+    return this.idToken ? { 'Authorization': `Bearer ${this.idToken}` } : {};
+  }
+
+  /**
+   * Fetch an identity token for the target audience (failures are not cached)
+   */
+  private async fetchIdToken(): Promise<string | null> {
     try {
       // Use the metadata server to get an identity token for the target audience
       const metadataServerUrl = 'http://metadata.google.internal/computeMetadata/v1/instance/service-accounts/default/identity';
@@ -72,13 +104,24 @@ export class ConversationClient {
         timeout: 5000
       });
 
-      const idToken = response.data;
-      return { 'Authorization': `Bearer ${idToken}` };
+      this.idToken = response.data;
+      this.idTokenExpiresAt = getIdTokenExpiry(response.data);
+      return this.idToken;
     } catch (error: any) {
       console.warn('Failed to get auth token from metadata server, proceeding without auth', {
         error: error.message
       });
-      return {};
+      return null;
+    }
+  }
+
+  /**
+   * Drop the cached identity token if the service rejected it
+   */
+  private handleAuthError(error: any): void {
+    if (error.response?.status === 401) {
+      this.idToken = null;
+      this.idTokenExpiresAt = 0;
     }
   }
 
@@ -106,6 +149,7 @@ export class ConversationClient {
       });
       return response.data.context;
     } catch (error: any) {
+      this.handleAuthError(error);
       console.warn('Failed to get conversation context, proceeding without history', {
         error: error.message,
         userId,
@@ -143,6 +187,7 @@ export class ConversationClient {
         headers: authHeaders
       });
     } catch (error: any) {
+      this.handleAuthError(error);
       console.error('Failed to store message in conversation history', {
         error: error.message,
         userId,
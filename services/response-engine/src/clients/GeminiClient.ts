@@ -1,20 +1,9 @@
 import { VertexAI, GenerativeModel, FunctionDeclaration } from '@google-cloud/vertexai';
 
-interface GeminiFunction {
-  name: string;
-  description?: string;
-  parameters?: any;
-}
-
-interface GeminiMessage {
-  role: 'user' | 'model' | 'function';
-  parts: any[];
-}
-
 interface GenerateResponseInput {
   userMessage: string;
   context?: string;
-  availableFunctions?: GeminiFunction[];
+  availableFunctions?: FunctionDeclaration[];
 }
 
 interface GenerateResponseOutput {
@@ -32,7 +21,42 @@ interface GenerateChatResponseInput {
     role: 'user' | 'model';
     content: string;
   }>;
-  availableFunctions?: GeminiFunction[];
+  availableFunctions?: FunctionDeclaration[];
+  presetFunctionCall?: {  // Skip Gemini's function selection when already resolved
+    name: string;
+    args: Record<string, any>;
+  };
+}
+
+// Length of the thinking summary preview included in logs
+const THINKING_PREVIEW_CHARS = 200;
+
+// Max function calls from one model turn executed concurrently (BigQuery procedure calls)
+const MAX_PARALLEL_FUNCTION_CALLS = 8;
+
+/**
+ * Map items through an async function with bounded concurrency, preserving input order
+ */
+async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T) => Promise<R>
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let nextIndex = 0;
+
+  const worker = async (): Promise<void> => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      results[index] = await fn(items[index]);
+    }
+  };
+
+  await Promise.all(
+    Array.from({ length: Math.min(limit, items.length) }, () => worker())
+  );
+
+  return results;
 }
 
 /**
@@ -191,11 +215,7 @@ export class GeminiClient {
       const history = this.convertToGeminiHistory(input.conversationHistory);
 
       // Prepare function declarations
-      const functionDeclarations: FunctionDeclaration[] = (input.availableFunctions || []).map(fn => ({
-        name: fn.name,
-        description: fn.description,
-        parameters: fn.parameters
-      }));
+      const functionDeclarations = input.availableFunctions || [];
 
       // Create model with system instruction and tools
       const modelConfig: any = {
@@ -298,17 +318,17 @@ export class GeminiClient {
       }
 
       // No function call, extract thinking and return text
-      const { thinkingSummaries, answerText } = this.extractThinkingAndAnswer(candidates);
+      const { thinkingCount, thinkingPreview, answerText } = this.extractThinkingAndAnswer(candidates);
 
       const parseDuration = Date.now() - parseStart;
 
       // Log thinking summaries for test analysis
-      if (thinkingSummaries.length > 0) {
+      if (thinkingCount > 0) {
         console.log(JSON.stringify({
           severity: 'DEBUG',
           message: 'Gemini thinking summary captured',
-          thinkingCount: thinkingSummaries.length,
-          thinkingPreview: thinkingSummaries[0].substring(0, 200),
+          thinkingCount,
+          thinkingPreview,
           thoughtsTokenCount: (response.usageMetadata as any)?.thoughtsTokenCount || 0
         }));
       }
@@ -317,7 +337,7 @@ export class GeminiClient {
         severity: 'DEBUG',
         message: 'Response parsed (text response)',
         durationMs: parseDuration,
-        hasThinking: thinkingSummaries.length > 0
+        hasThinking: thinkingCount > 0
       }));
 
       return { text: answerText };
@@ -356,19 +376,12 @@ export class GeminiClient {
    */
   private async generateWithFunctions(
     prompt: string,
-    functions: GeminiFunction[]
+    functions: FunctionDeclaration[]
   ): Promise<GenerateResponseOutput> {
-    // Convert to Gemini function declarations
-    const functionDeclarations: FunctionDeclaration[] = functions.map(fn => ({
-      name: fn.name,
-      description: fn.description,
-      parameters: fn.parameters
-    }));
-
     // Create model with functions
     const model = this.vertexAI.getGenerativeModel({
       model: this.modelName,
-      tools: [{ functionDeclarations }]
+      tools: [{ functionDeclarations: functions }]
     });
 
     // Generate content
@@ -504,11 +517,7 @@ export class GeminiClient {
       const history = this.convertToGeminiHistory(input.conversationHistory);
 
       // Prepare function declarations
-      const functionDeclarations: FunctionDeclaration[] = (input.availableFunctions || []).map(fn => ({
-        name: fn.name,
-        description: fn.description,
-        parameters: fn.parameters
-      }));
+      const functionDeclarations = input.availableFunctions || [];
 
       const prepDuration = Date.now() - prepStart;
       console.log(JSON.stringify({
@@ -520,105 +529,20 @@ export class GeminiClient {
 
       // ============================================================
       // STEP 1: Force function call with mode: 'ANY' (stateless)
+      // Skipped when the query was already routed to a function deterministically
       // ============================================================
 
-      // Manually construct contents for stateless call
-      const contents: any[] = [
-        ...history,
-        { role: 'user', parts: [{ text: input.userMessage }] }
-      ];
-
-      // Create model config with mode: 'ANY' to force function call
-      const modelConfigWithAny: any = {
-        model: modelToUse,
-        systemInstruction: {
-          parts: [{ text: input.systemInstruction }]
-        },
-        generationConfig: {
-          temperature: 1,
-          topP: 0.95,
-          thinkingConfig: {
-            thinkingBudget: 1024,
-            includeThoughts: true
-          }
-        }
-      };
-
-      if (functionDeclarations.length > 0) {
-        modelConfigWithAny.tools = [{ functionDeclarations }];
-        modelConfigWithAny.toolConfig = {
-          functionCallingConfig: {
-            mode: 'ANY'  // Force function call on this turn only
-          }
-        };
-      }
-
-      const modelForFirstCall = this.vertexAI.getGenerativeModel(modelConfigWithAny);
-
-      console.log(JSON.stringify({
-        severity: 'DEBUG',
-        message: 'Sending stateless call with mode: ANY to force function call',
-        messageLength: input.userMessage.length,
-        location: this.location
-      }));
-
-      const apiCall1Start = Date.now();
-      const result1 = await modelForFirstCall.generateContent({
-        contents: contents
-      });
-      const apiCall1Duration = Date.now() - apiCall1Start;
-
-      console.log(JSON.stringify({
-        severity: 'INFO',
-        message: 'Stateless function call received',
-        model: modelToUse,
-        durationMs: apiCall1Duration,
-        location: this.location
-      }));
-
-      // Extract function calls from response
-      const response1 = result1.response;
-      const candidates1 = response1.candidates || [];
-
-      if (candidates1.length === 0 || !candidates1[0].content?.parts) {
-        throw new Error('No function call received despite mode: ANY');
-      }
-
-      // Extract ALL function calls (support parallel function calling)
-      const functionCalls: Array<{ name: string; args: Record<string, any> }> = [];
-      const functionCallParts: any[] = [];
-
-      for (const part of candidates1[0].content.parts) {
-        if (part.functionCall) {
-          functionCalls.push({
-            name: part.functionCall.name,
-            args: part.functionCall.args as Record<string, any>
-          });
-          functionCallParts.push(part);  // Save original parts for history
-        }
-      }
-
-      if (functionCalls.length === 0) {
-        throw new Error('No function call found in response despite mode: ANY');
-      }
-
-      console.log(JSON.stringify({
-        severity: 'DEBUG',
-        message: 'Function calls extracted from stateless call',
-        count: functionCalls.length,
-        functions: functionCalls.map(fc => fc.name)
-      }));
+      const { functionCalls, functionCallParts } = input.presetFunctionCall
+        ? this.usePresetFunctionCall(input.presetFunctionCall)
+        : await this.selectFunctionCalls(input, history, functionDeclarations, modelToUse);
 
       // ============================================================
-      // STEP 2: Execute ALL functions
+      // STEP 2: Execute ALL functions (independent calls run concurrently)
       // ============================================================
 
       const toolStart = Date.now();
-      const functionResults: Array<{ name: string; result: any }> = [];
-
-      for (const fc of functionCalls) {
+      const functionResults = await mapWithConcurrency(functionCalls, MAX_PARALLEL_FUNCTION_CALLS, async (fc) => {
         const result = await executeFunction(fc.name, fc.args);
-        functionResults.push({ name: fc.name, result });
 
         const resultSize = JSON.stringify(result).length;
         console.log(JSON.stringify({
@@ -629,7 +553,9 @@ export class GeminiClient {
           resultType: typeof result,
           resultKeys: typeof result === 'object' && result ? Object.keys(result) : []
         }));
-      }
+
+        return { name: fc.name, result };
+      });
 
       const toolExecutionMs = Date.now() - toolStart;
 
@@ -700,15 +626,15 @@ export class GeminiClient {
       const response2 = result2.response;
       const candidates2 = response2.candidates || [];
 
-      const { thinkingSummaries, answerText } = this.extractThinkingAndAnswer(candidates2);
+      const { thinkingCount, thinkingPreview, answerText } = this.extractThinkingAndAnswer(candidates2);
 
       // Log thinking summaries for test analysis
-      if (thinkingSummaries.length > 0) {
+      if (thinkingCount > 0) {
         console.log(JSON.stringify({
           severity: 'DEBUG',
           message: 'Gemini thinking summary captured (hybrid approach)',
-          thinkingCount: thinkingSummaries.length,
-          thinkingPreview: thinkingSummaries[0].substring(0, 200),
+          thinkingCount,
+          thinkingPreview,
           thoughtsTokenCount: (response2.usageMetadata as any)?.thoughtsTokenCount || 0
         }));
       }
@@ -719,7 +645,7 @@ export class GeminiClient {
         message: 'Final text response received (hybrid approach)',
         textLength: answerText.length,
         responsePreview: answerText.substring(0, 200),
-        hasThinking: thinkingSummaries.length > 0
+        hasThinking: thinkingCount > 0
       };
 
       console.log(JSON.stringify(logData));
@@ -745,28 +671,155 @@ export class GeminiClient {
     }
   }
 
+  /**
+   * Step 1 of hybrid function calling: ask Gemini which function(s) to call (mode: ANY)
+   */
+  private async selectFunctionCalls(
+    input: GenerateChatResponseInput,
+    history: any[],
+    functionDeclarations: FunctionDeclaration[],
+    modelToUse: string
+  ): Promise<{
+    functionCalls: Array<{ name: string; args: Record<string, any> }>;
+    functionCallParts: any[];
+  }> {
+
+    // Manually construct contents for stateless call
+    const contents: any[] = [
+      ...history,
+      { role: 'user', parts: [{ text: input.userMessage }] }
+    ];
+
+    // Create model config with mode: 'ANY' to force function call
+    const modelConfigWithAny: any = {
+      model: modelToUse,
+      systemInstruction: {
+        parts: [{ text: input.systemInstruction }]
+      },
+      generationConfig: {
+        temperature: 1,
+        topP: 0.95,
+        thinkingConfig: {
+          thinkingBudget: 1024,
+          includeThoughts: true
+        }
+      }
+    };
+
+    if (functionDeclarations.length > 0) {
+      modelConfigWithAny.tools = [{ functionDeclarations }];
+      modelConfigWithAny.toolConfig = {
+        functionCallingConfig: {
+          mode: 'ANY'  // Force function call on this turn only
+        }
+      };
+    }
+
+    const modelForFirstCall = this.vertexAI.getGenerativeModel(modelConfigWithAny);
+
+    console.log(JSON.stringify({
+      severity: 'DEBUG',
+      message: 'Sending stateless call with mode: ANY to force function call',
+      messageLength: input.userMessage.length,
+      location: this.location
+    }));
+
+    const apiCall1Start = Date.now();
+    const result1 = await modelForFirstCall.generateContent({
+      contents: contents
+    });
+    const apiCall1Duration = Date.now() - apiCall1Start;
+
+    console.log(JSON.stringify({
+      severity: 'INFO',
+      message: 'Stateless function call received',
+      model: modelToUse,
+      durationMs: apiCall1Duration,
+      location: this.location
+    }));
+
+    // Extract function calls from response
+    const response1 = result1.response;
+    const candidates1 = response1.candidates || [];
+
+    if (candidates1.length === 0 || !candidates1[0].content?.parts) {
+      throw new Error('No function call received despite mode: ANY');
+    }
+
+    // Extract ALL function calls (support parallel function calling)
+    const functionCalls: Array<{ name: string; args: Record<string, any> }> = [];
+    const functionCallParts: any[] = [];
+
+    for (const part of candidates1[0].content.parts) {
+      if (part.functionCall) {
+        functionCalls.push({
+          name: part.functionCall.name,
+          args: part.functionCall.args as Record<string, any>
+        });
+        functionCallParts.push(part);  // Save original parts for history
+      }
+    }
+
+    if (functionCalls.length === 0) {
+      throw new Error('No function call found in response despite mode: ANY');
+    }
+
+    console.log(JSON.stringify({
+      severity: 'DEBUG',
+      message: 'Function calls extracted from stateless call',
+      count: functionCalls.length,
+      functions: functionCalls.map(fc => fc.name)
+    }));
+
+    return { functionCalls, functionCallParts };
+  }
+
+  /**
+   * Use a deterministically routed function call in place of step 1
+   */
+  private usePresetFunctionCall(presetFunctionCall: { name: string; args: Record<string, any> }): {
+    functionCalls: Array<{ name: string; args: Record<string, any> }>;
+    functionCallParts: any[];
+  } {
+    console.log(JSON.stringify({
+      severity: 'DEBUG',
+      message: 'Using preset function call (skipping function selection call)',
+      functionName: presetFunctionCall.name
+    }));
+
+    return {
+      functionCalls: [presetFunctionCall],
+      functionCallParts: [{ functionCall: presetFunctionCall }]
+    };
+  }
+
   /**
    * Extract thinking summaries and final answer from response parts
    * With thinking mode enabled, response.candidates[0].content.parts contains:
-   * - Parts with .thought property = thinking summaries (for logging)
+   * - Parts with .thought property = thinking summaries (only counted and previewed for logging)
    * - Parts without .thought = final answer (for users)
    */
   private extractThinkingAndAnswer(candidates: any[]): {
-    thinkingSummaries: string[];
+    thinkingCount: number;
+    thinkingPreview: string;
     answerText: string;
   } {
-    const thinkingSummaries: string[] = [];
+    let thinkingCount = 0;
+    let thinkingPreview = '';
     const answerParts: string[] = [];
 
     if (candidates.length === 0 || !candidates[0].content?.parts) {
-      return { thinkingSummaries, answerText: '' };
+      return { thinkingCount, thinkingPreview, answerText: '' };
     }
 
     for (const part of candidates[0].content.parts) {
       if (part.thought) {
-        // This part contains thinking summary
+        // Thinking summary - keep only a short preview of the first one
         if (part.text) {
-          thinkingSummaries.push(part.text);
+          if (thinkingCount === 0) {
+            thinkingPreview = part.text.substring(0, THINKING_PREVIEW_CHARS);
+          }
+          thinkingCount++;
         }
       } else if (part.text) {
         // This part contains final answer
@@ -775,7 +828,8 @@ export class GeminiClient {
     }
 
     return {
-      thinkingSummaries,
+      thinkingCount,
+      thinkingPreview,
       answerText: answerParts.join('')
     };
   }
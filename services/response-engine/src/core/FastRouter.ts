@@ -0,0 +1,101 @@
+// Fast Router
+// Resolves trivial, fully specified queries (e.g. "top 5 items in july 2025")
+// directly to an intent function call, skipping Gemini's function selection call.
+// Anything not matched exactly falls through to Gemini.
+
+export interface RoutedFunctionCall {
+  name: string;
+  args: Record<string, any>;
+}
+
+interface Route {
+  pattern: RegExp;
+  build: (match: RegExpMatchArray) => RoutedFunctionCall;
+}
+
+const MONTHS: Record<string, number> = {
+  january: 1, jan: 1,
+  february: 2, feb: 2,
+  march: 3, mar: 3,
+  april: 4, apr: 4,
+  may: 5,
+  june: 6, jun: 6,
+  july: 7, jul: 7,
+  august: 8, aug: 8,
+  september: 9, sept: 9, sep: 9,
+  october: 10, oct: 10,
+  november: 11, nov: 11,
+  december: 12, dec: 12
+};
+
+// "in july 2025" / "for jul, 2025" - an explicit month and year are required
+const PERIOD = `(?:in|for|during) (${Object.keys(MONTHS).join('|')}),? (\\d{4})`;
+
+/**
+ * Get the first and last day of a month as YYYY-MM-DD
+ */
+function monthRange(monthName: string, year: string): { startDate: string; endDate: string } {
+  const month = MONTHS[monthName];
+  const lastDay = new Date(Date.UTC(Number(year), month, 0)).getUTCDate();
+  const mm = String(month).padStart(2, '0');
+
+  return {
+    startDate: `${year}-${mm}-01`,
+    endDate: `${year}-${mm}-${String(lastDay).padStart(2, '0')}`
+  };
+}
+
+/**
+ * FastRouter - Deterministic dispatch for trivial queries
+ *
+ * Handles:
+ * - Top N items for a month
+ * - Total sales for a month
+ * - Category breakdown for a month
+ */
+export class FastRouter {
+  private routes: Route[] = [
+    {
+      pattern: new RegExp(`^(?:what (?:were|are) )?(?:show (?:me )?)?(?:the )?top ([1-9]\\d{0,2}) (?:best[- ]?)?(?:selling )?items ${PERIOD}$`),
+      build: match => ({
+        name: 'show_top_items',
+        args: { limit: parseInt(match[1], 10), ...monthRange(match[2], match[3]) }
+      })
+    },
+    {
+      pattern: new RegExp(`^(?:what (?:was|were) )?(?:the )?total sales ${PERIOD}$`),
+      build: match => ({
+        name: 'get_total_sales',
+        args: monthRange(match[1], match[2])
+      })
+    },
+    {
+      pattern: new RegExp(`^(?:show (?:me )?)?(?:the )?(?:sales by category|category breakdown) ${PERIOD}$`),
+      build: match => ({
+        name: 'show_category_breakdown',
+        args: monthRange(match[1], match[2])
+      })
+    }
+  ];
+
+  /**
+   * Resolve a user message to a function call
+   * @returns RoutedFunctionCall if the message matches a route exactly, null otherwise
+   */
+  route(userMessage: string): RoutedFunctionCall | null {
+    const normalized = userMessage
+      .trim()
+      .toLowerCase()
+      .replace(/\s+/g, ' ')
+      .replace(/[?.!]+$/, '');
+
+    for (const route of this.routes) {
+      const match = normalized.match(route.pattern);
+      if (match) {
+        return route.build(match);
+      }
+    }
+
+    return null;
+  }
+}
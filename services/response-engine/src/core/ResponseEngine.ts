@@ -54,6 +54,20 @@ export class ResponseEngine {
     this.responseFormatter = new ResponseFormatter(config.defaultCurrency);
   }
 
+  /**
+   * Warm up response generation in the background (called once at startup)
+   */
+  async warmUp(): Promise<void> {
+    const startTime = Date.now();
+    await this.responseGenerator.warmUp();
+
+    console.log(JSON.stringify({
+      severity: 'INFO',
+      message: 'Response engine warm-up completed',
+      durationMs: Date.now() - startTime
+    }));
+  }
+
   /**
    * Handle incoming chat message
    */
@@ -102,7 +116,8 @@ export class ResponseEngine {
         context,
         tenantConfig,
         currentDateTime: new Date(),
-        availableCategories: []
+        availableCategories: [],
+        sessionId: request.threadId || request.messageId
       });
       timings.generateResponse = Date.now() - step3Start;
 
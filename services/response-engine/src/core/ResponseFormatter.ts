@@ -1,5 +1,3 @@
-import { ChartSpec } from '../chart/chartTypes';
-
 interface Card {
   header?: {
     title: string;
@@ -6,6 +6,11 @@ import { TenantConfig } from '../config/tenantConfig';
 import { formatChartLabel } from '@fdsanalytics/shared';
 import { INTENT_FUNCTIONS } from '../tools/intentFunctions';
 import { AnalyticsToolHandler } from '../tools/AnalyticsToolHandler';
+import { ToolResultCache, toolCallKey } from '../tools/ToolResultCache';
+import { FastRouter } from './FastRouter';
+
+// Cross-conversation cache scope for results over closed periods
+const SHARED_CACHE_SCOPE = 'shared';
 
 interface ConversationContext {
   relevantMessages: Array<{
@@ -27,6 +32,7 @@ export interface ResponseGeneratorInput {
   tenantConfig: TenantConfig;
   currentDateTime: Date;
   availableCategories: string[];
+  sessionId?: string;  // Conversation ID - scopes cached tool results
 }
 
 export interface ResponseGeneratorOutput {
@@ -56,6 +62,9 @@ export class ResponseGenerator {
   private chartBuilder: ChartBuilder;
   private chartTypeSelector: ChartTypeSelector;
   private analyticsToolHandler: AnalyticsToolHandler;
+  private toolResultCache: ToolResultCache;
+  private sharedToolResultCache: ToolResultCache;
+  private fastRouter: FastRouter;
 
   constructor(
     private geminiClient: GeminiClient,
@@ -65,6 +74,20 @@ export class ResponseGenerator {
     this.chartBuilder = new ChartBuilder();
     this.chartTypeSelector = new ChartTypeSelector(geminiClient);
     this.analyticsToolHandler = new AnalyticsToolHandler();
+    this.toolResultCache = new ToolResultCache();
+    this.sharedToolResultCache = new ToolResultCache(60 * 60 * 1000, 1, 200);  // 1 hour, one shared scope
+    this.fastRouter = new FastRouter();
+  }
+
+  /**
+   * Warm up the Gemini model and tool handler caches
+   * Safe to call without awaiting - requests arriving meanwhile share the in-flight lookups
+   */
+  async warmUp(): Promise<void> {
+    await Promise.all([
+      this.geminiClient.initialize(),
+      this.analyticsToolHandler.warmUp()
+    ]);
   }
 
   /**
@@ -77,6 +100,7 @@ export class ResponseGenerator {
     let responseText = '';
     let chartUrl: string | null = null;
     let chartTitle: string | undefined;
+    let fastRouted = false;
 
     try {
       // Step 1: Build system instruction and conversation history
@@ -86,34 +110,44 @@ export class ResponseGenerator {
       timings.buildContext = Date.now() - step1Start;
 
       // DEBUG: Check conversation context and history
-      console.log('DEBUG: Conversation context check:', JSON.stringify({
+      // Single-line JSON so each log is one structured Cloud Logging entry
+      console.log(JSON.stringify({
+        severity: 'DEBUG',
+        message: 'Conversation context check',
         hasContext: !!input.context,
         hasRelevantMessages: !!(input.context?.relevantMessages),
         messageCount: input.context?.relevantMessages?.length || 0,
         messages: input.context?.relevantMessages || [],
         currentMessage: input.userMessage
-      }, null, 2));
+      }));
 
-      console.log('DEBUG: Converted history for Gemini:', JSON.stringify({
+      console.log(JSON.stringify({
+        severity: 'DEBUG',
+        message: 'Converted history for Gemini',
         historyLength: conversationHistory.length,
         history: conversationHistory,
         systemInstructionLength: systemInstruction.length
-      }, null, 2));
+      }));
 
       // Step 2: Use continuous chat for function calling (ONE Gemini session)
       // This eliminates the "fake history" overhead of two separate API calls
       // Use gemini-2.5-flash-lite for ultra-fast processing
       const step2Start = Date.now();
 
+      // Identical calls in flight at the same time share one execution
+      // (entries are removed once settled, so a retried call after a failure runs again)
+      const inFlightToolCalls = new Map<string, Promise<any>>();
+
+      // Trivial queries resolve to a function call without Gemini's selection call
+      const presetFunctionCall = this.fastRouter.route(input.userMessage);
+      fastRouted = presetFunctionCall !== null;
+
       const chatResult = await this.geminiClient.generateWithFunctionCalling({
         userMessage: input.userMessage,
         systemInstruction: systemInstruction,
         conversationHistory: conversationHistory,  // Use actual conversation history
-        availableFunctions: INTENT_FUNCTIONS.map(fn => ({
-          name: fn.name,
-          description: fn.description,
-          parameters: fn.parameters
-        }))
+        availableFunctions: INTENT_FUNCTIONS,
+        presetFunctionCall: presetFunctionCall || undefined
       }, async (functionName: string, functionArgs: Record<string, any>) => {
         // This callback executes the function within the continuous chat
         console.log(JSON.stringify({
@@ -122,9 +156,23 @@ export class ResponseGenerator {
           functionName: functionName,
           extractedParameters: functionArgs,
           userMessage: input.userMessage
-        }, null, 2));
+        }));
 
-        return await this.analyticsToolHandler.execute(functionName, functionArgs);
+        const callKey = toolCallKey(functionName, functionArgs);
+        let pending = inFlightToolCalls.get(callKey);
+        if (pending) {
+          console.log(JSON.stringify({
+            severity: 'DEBUG',
+            message: 'Duplicate tool call coalesced',
+            functionName
+          }));
+        } else {
+          pending = this.executeTool(functionName, functionArgs, input.sessionId)
+            .finally(() => inFlightToolCalls.delete(callKey));
+          inFlightToolCalls.set(callKey, pending);
+        }
+
+        return await pending;
       }, 'gemini-2.5-flash');  // Use flash for better reasoning
 
       const totalGeminiDuration = Date.now() - step2Start;
@@ -211,6 +259,7 @@ export class ResponseGenerator {
       },
       geminiOnlyMs: (timings.geminiContinuousChat || 0) - (timings.intentFunctionExecution || 0),
       toolCallsCount: toolCalls.length,
+      fastRouted,
       chartGenerated: chartUrl !== null
     }));
 
@@ -222,16 +271,100 @@ export class ResponseGenerator {
     };
   }
 
+  /**
+   * Execute an intent function, reusing cached results where possible
+   * - Same conversation: any repeated call within the TTL
+   * - Across conversations: calls over periods that end before the latest report (data is final)
+   */
+  private async executeTool(
+    functionName: string,
+    functionArgs: Record<string, any>,
+    sessionId?: string
+  ): Promise<any> {
+    if (sessionId) {
+      const cached = this.toolResultCache.get(sessionId, functionName, functionArgs);
+      if (cached !== undefined) {
+        console.log(JSON.stringify({
+          severity: 'DEBUG',
+          message: 'Tool result cache hit',
+          cacheScope: 'session',
+          functionName,
+          sessionId
+        }));
+        return cached;
+      }
+    }
+
+    const shareable = await this.isClosedPeriod(functionArgs);
+    if (shareable) {
+      const cached = this.sharedToolResultCache.get(SHARED_CACHE_SCOPE, functionName, functionArgs);
+      if (cached !== undefined) {
+        console.log(JSON.stringify({
+          severity: 'DEBUG',
+          message: 'Tool result cache hit',
+          cacheScope: 'shared',
+          functionName
+        }));
+        if (sessionId) {
+          this.toolResultCache.set(sessionId, functionName, functionArgs, cached);
+        }
+        return cached;
+      }
+    }
+
+    const result = await this.analyticsToolHandler.execute(functionName, functionArgs);
+
+    if (sessionId) {
+      this.toolResultCache.set(sessionId, functionName, functionArgs, result);
+    }
+    if (shareable) {
+      this.sharedToolResultCache.set(SHARED_CACHE_SCOPE, functionName, functionArgs, result);
+    }
+
+    return result;
+  }
+
+  /**
+   * Check whether every end date in the args is before the latest available report date
+   * Results for such periods won't change, so they are safe to share across conversations
+   */
+  private async isClosedPeriod(functionArgs: Record<string, any>): Promise<boolean> {
+    const endDates = Object.keys(functionArgs)
+      .filter(key => key.startsWith('endDate'))
+      .map(key => functionArgs[key]);
+
+    if (endDates.length === 0) {
+      return false;
+    }
+
+    const latestDate = await this.analyticsToolHandler.getLatestAvailableDate();
+    if (!latestDate) {
+      return false;
+    }
+
+    // YYYY-MM-DD strings compare correctly as plain strings
+    return endDates.every(endDate =>
+      typeof endDate === 'string' && /^\d{4}-\d{2}-\d{2}$/.test(endDate) && endDate < latestDate
+    );
+  }
+
   /**
    * Build system instruction for Gemini (persistent context)
    * Minimal instruction - rely on tool schema and multi-turn chat for the rest
+   *
+   * Stable text comes first and per-request values (current time, data availability) last,
+   * so Gemini's implicit prefix caching can reuse the shared prefix across requests.
+   * The current time is truncated to the minute for the same reason.
    */
   private async buildSystemInstruction(input: ResponseGeneratorInput): Promise<string> {
     const currentYear = input.currentDateTime.getFullYear();
+    const currentDateTime = input.currentDateTime.toISOString().substring(0, 16) + 'Z';
 
     // Get data availability dates dynamically
-    const latestDate = await this.analyticsToolHandler.getLatestAvailableDate();
-    const firstDate = await this.analyticsToolHandler.getFirstAvailableDate();
+    const [latestDate, firstDate] = await Promise.all([
+      this.analyticsToolHandler.getLatestAvailableDate(),
+      this.analyticsToolHandler.getFirstAvailableDate()
+    ]);
 
     let dataAvailabilityNote = '';
     if (latestDate) {
@@ -244,13 +377,14 @@ export class ResponseGenerator {
     return `You are an analytics assistant for ${input.tenantConfig.businessName}.
 Business timezone: ${input.tenantConfig.timezone}
 Currency: ${input.tenantConfig.currency}
-Current date and time: ${input.currentDateTime.toISOString()}
-Current year: ${currentYear}${dataAvailabilityNote}
 
 IMPORTANT:
-- When users mention months without specifying a year (e.g., "May and June"), assume they mean the current year (${currentYear}) unless context suggests otherwise.
-- When users say "last month", "this month", "last quarter", etc., calculate the actual dates based on the current date above.
-- If querying for dates beyond the latest available data, explain that data is only available through ${latestDate || 'the latest report date'}.`;
+- When users mention months without specifying a year (e.g., "May and June"), assume they mean the current year unless context suggests otherwise.
+- When users say "last month", "this month", "last quarter", etc., calculate the actual dates based on the current date below.
+- If querying for dates beyond the latest available data, explain that data is only available through the latest report date below.
+
+Current date and time: ${currentDateTime}
+Current year: ${currentYear}${dataAvailabilityNote}`;
   }
 
   /**
@@ -483,8 +617,10 @@ IMPORTANT:
     const suggestions: string[] = [];
 
     // Get data availability dates
-    const latestDate = await this.analyticsToolHandler.getLatestAvailableDate();
-    const firstDate = await this.analyticsToolHandler.getFirstAvailableDate();
+    const [latestDate, firstDate] = await Promise.all([
+      this.analyticsToolHandler.getLatestAvailableDate(),
+      this.analyticsToolHandler.getFirstAvailableDate()
+    ]);
 
     suggestions.push('No data found for that query.');
     suggestions.push('');
@@ -31,6 +31,13 @@ export function createServer(config: Config): express.Application {
     geminiClient
   );
 
+  // Warm up in the background - keeps startup and health checks off the critical path
+  responseEngine.warmUp().catch((error: any) => {
+    console.warn('Background warm-up failed (non-blocking)', {
+      error: error.message
+    });
+  });
+
   // Health check endpoint
   app.get('/health', (req: Request, res: Response) => {
     res.json({
@@ -19,6 +19,11 @@ export class AnalyticsToolHandler {
   private latestDateCache: string | null = null;
   private firstDateCache: string | null = null;
 
+  // In-flight lookups, shared so a request arriving during warm-up doesn't query twice
+  private primaryCategoriesPending: Promise<string[]> | null = null;
+  private latestDatePending: Promise<string | null> | null = null;
+  private firstDatePending: Promise<string | null> | null = null;
+
   constructor(
     projectId: string = 'fdsanalytics',
     dataset: string = 'restaurant_analytics',
@@ -30,6 +35,18 @@ export class AnalyticsToolHandler {
     this.bqClient = new BigQuery({ projectId });
   }
 
+  /**
+   * Warm up lookup caches (primary categories, data availability dates)
+   * Called in the background at startup so the first request doesn't pay for them
+   */
+  async warmUp(): Promise<void> {
+    await Promise.all([
+      this.getPrimaryCategories(),
+      this.getLatestAvailableDate(),
+      this.getFirstAvailableDate()
+    ]);
+  }
+
   /**
    * Execute an intent function
    */
@@ -597,6 +614,19 @@ export class AnalyticsToolHandler {
       return this.latestDateCache;
     }
 
+    if (!this.latestDatePending) {
+      this.latestDatePending = this.fetchLatestAvailableDate().finally(() => {
+        this.latestDatePending = null;
+      });
+    }
+
+    return this.latestDatePending;
+  }
+
+  /**
+   * Query latest available date from BigQuery
+   */
+  private async fetchLatestAvailableDate(): Promise<string | null> {
     try {
       const query = `
         SELECT MAX(report_date) as latest_date
@@ -638,6 +668,19 @@ export class AnalyticsToolHandler {
       return this.firstDateCache;
     }
 
+    if (!this.firstDatePending) {
+      this.firstDatePending = this.fetchFirstAvailableDate().finally(() => {
+        this.firstDatePending = null;
+      });
+    }
+
+    return this.firstDatePending;
+  }
+
+  /**
+   * Query first available date from BigQuery
+   */
+  private async fetchFirstAvailableDate(): Promise<string | null> {
     try {
       const query = `
         SELECT MIN(report_date) as first_date
@@ -701,6 +744,19 @@ export class AnalyticsToolHandler {
       return this.primaryCategoriesCache;
     }
 
+    if (!this.primaryCategoriesPending) {
+      this.primaryCategoriesPending = this.fetchPrimaryCategories().finally(() => {
+        this.primaryCategoriesPending = null;
+      });
+    }
+
+    return this.primaryCategoriesPending;
+  }
+
+  /**
+   * Query primary categories from BigQuery
+   */
+  private async fetchPrimaryCategories(): Promise<string[]> {
     try {
       const query = `
         SELECT DISTINCT primary_category
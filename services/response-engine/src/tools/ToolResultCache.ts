@@ -0,0 +1,122 @@
+// Tool Result Cache
+// Memoizes intent function results per conversation so follow-up turns that
+// repeat the same function + arguments skip the BigQuery round-trip
+
+interface CacheEntry {
+  result: any;
+  expiresAt: number;
+}
+
+/**
+ * Build a stable key for a tool call (independent of argument order)
+ */
+export function toolCallKey(functionName: string, args: Record<string, any>): string {
+  const sortedArgs = Object.keys(args || {})
+    .sort()
+    .map(key => [key, args[key]]);
+
+  return `${functionName}:${JSON.stringify(sortedArgs)}`;
+}
+
+/**
+ * ToolResultCache - Session-scoped memo of intent function results
+ *
+ * Handles:
+ * - Caching results per conversation (sessionId = thread ID)
+ * - Expiring entries after a TTL so new data is picked up (pruned on read and on write)
+ * - Evicting least recently used sessions (there is no session-close event)
+ * - Bounding entries per session (oldest evicted first)
+ */
+export class ToolResultCache {
+  private sessions = new Map<string, Map<string, CacheEntry>>();
+
+  constructor(
+    private ttlMs: number = 5 * 60 * 1000,  // 5 minutes
+    private maxSessions: number = 500,
+    private maxEntriesPerSession: number = 50
+  ) {}
+
+  /**
+   * Get a cached result, or undefined on miss/expiry
+   */
+  get(sessionId: string, functionName: string, args: Record<string, any>): any | undefined {
+    const session = this.sessions.get(sessionId);
+    if (!session) {
+      return undefined;
+    }
+
+    const key = toolCallKey(functionName, args);
+    const entry = session.get(key);
+    if (!entry) {
+      return undefined;
+    }
+
+    if (entry.expiresAt <= Date.now()) {
+      session.delete(key);
+      if (session.size === 0) {
+        this.sessions.delete(sessionId);
+      }
+      return undefined;
+    }
+
+    // Re-insert to mark as most recently used (reads count as use too)
+    this.sessions.delete(sessionId);
+    this.sessions.set(sessionId, session);
+
+    return entry.result;
+  }
+
+  /**
+   * Cache a result for a session
+   */
+  set(sessionId: string, functionName: string, args: Record<string, any>, result: any): void {
+    let session = this.sessions.get(sessionId);
+
+    if (session) {
+      // Re-insert to mark as most recently used
+      this.sessions.delete(sessionId);
+    } else {
+      session = new Map();
+    }
+
+    this.sessions.set(sessionId, session);
+
+    // Drop expired entries so keys that are never read again don't linger
+    const now = Date.now();
+    for (const [entryKey, entry] of session) {
+      if (entry.expiresAt <= now) {
+        session.delete(entryKey);
+      }
+    }
+
+    const key = toolCallKey(functionName, args);
+    session.delete(key);
+    session.set(key, {
+      result,
+      expiresAt: now + this.ttlMs
+    });
+
+    // Evict oldest entries in this session
+    while (session.size > this.maxEntriesPerSession) {
+      const oldestKey = session.keys().next().value as string;
+      session.delete(oldestKey);
+    }
+
+    // Evict least recently used sessions (Map preserves insertion order)
+    while (this.sessions.size > this.maxSessions) {
+      const oldestSessionId = this.sessions.keys().next().value as string;
+      this.sessions.delete(oldestSessionId);
+    }
+  }
+
+  /**
+   * Drop cached results for one session, or all sessions
+   */
+  clear(sessionId?: string): void {
+    if (sessionId) {
+      this.sessions.delete(sessionId);
+    } else {
+      this.sessions.clear();
+    }
+  }
+}
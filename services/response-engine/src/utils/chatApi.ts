@@ -11,6 +11,22 @@ export interface ChatMessage {
   };
 }
 
+// Shared across posts so Application Default Credentials are resolved once
+// and the access token is reused until it nears expiry
+let chatAuth: GoogleAuth | null = null;
+
+/**
+ * Get the shared Chat API auth client (created on first use)
+ */
+function getChatAuth(): GoogleAuth {
+  if (!chatAuth) {
+    chatAuth = new GoogleAuth({
+      scopes: ['https://www.googleapis.com/auth/chat.bot']
+    });
+  }
+  return chatAuth;
+}
+
 /**
  * Post message to Google Chat using the Chat API
  */
@@ -20,11 +36,7 @@ export async function postMessageToChat(
 ): Promise<void> {
   try {
     // Use Application Default Credentials (service account)
-    const auth = new GoogleAuth({
-      scopes: ['https://www.googleapis.com/auth/chat.bot']
-    });
-
-    const client = await auth.getClient();
+    const client = await getChatAuth().getClient();
     const accessToken = await client.getAccessToken();
 
     if (!accessToken?.token) {